@@ -11,10 +11,10 @@ import re
 from pydantic_ai import Agent
 from pydantic import BaseModel, Field
 
-from .config import Config
+from .config import get_config
 
 logger = logging.getLogger(__name__)
-config = Config()
+config = get_config()
 
 class TranscriptSegment(BaseModel):
     """Represents a relevant segment of transcript with precise timing."""
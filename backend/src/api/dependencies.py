@@ -0,0 +1,16 @@
+"""
+Shared FastAPI dependencies.
+"""
+from arq.connections import ArqRedis
+from fastapi import Request
+
+from ..workers.job_queue import JobQueue
+
+
+async def get_arq_pool(request: Request) -> ArqRedis:
+    """Return the arq pool primed during startup."""
+    pool = getattr(request.app.state, "arq_pool", None)
+    if pool is None:
+        # Startup couldn't reach Redis: connect (with retries) on first use
+        pool = request.app.state.arq_pool = await JobQueue.get_pool()
+    return pool
@@ -8,10 +8,10 @@ import logging
 import uuid
 import aiofiles
 
-from ...config import Config
+from ...config import get_config
 
 logger = logging.getLogger(__name__)
-config = Config()
+config = get_config()
 router = APIRouter(tags=["media"])
 
 
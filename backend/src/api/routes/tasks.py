@@ -12,13 +12,14 @@ from typing import Dict, Any
 from ...database import get_db
 from ...services.task_service import TaskService
 from ...workers.job_queue import JobQueue
+from ..dependencies import get_arq_pool
 from ...workers.progress import ProgressTracker
-from ...config import Config
+from ...config import get_config
 from ...utils.validators import validate_task_input
 import redis.asyncio as redis
 
 logger = logging.getLogger(__name__)
-config = Config()
+config = get_config()
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 
@@ -66,7 +67,7 @@ async def create_task(request: Request, db: AsyncSession = Depends(get_db)):
     raw_source = data.get("source")
     
     # Get font options
-    font_options = data.get("font_options", {})
+    font_options = data.get("font_options") or {}
     font_family = font_options.get("font_family", "TikTokSans-Regular")
     font_size = font_options.get("font_size", 24)
     font_color = font_options.get("font_color", "#FFFFFF")
@@ -87,8 +88,11 @@ async def create_task(request: Request, db: AsyncSession = Depends(get_db)):
         # Get source type for worker
         source_type = task_service.video_service.determine_source_type(raw_source["url"])
 
-        # Enqueue job for worker
+        # Enqueue job for worker (pool is fetched only after auth/validation,
+        # so rejected requests never trigger Redis reconnect attempts)
+        arq_pool = await get_arq_pool(request)
         job_id = await JobQueue.enqueue(
+            arq_pool,
             "process_video_task",
             task_id=task_id,
             url=raw_source["url"],
@@ -195,10 +199,8 @@ async def get_task_progress_sse(task_id: str, db: AsyncSession = Depends(get_db)
             return
 
         # Connect to Redis for real-time updates
-        redis_client = redis.Redis(
-            host=config.redis_host,
-            port=config.redis_port,
-            password=config.redis_password,
+        redis_client = redis.Redis.from_url(
+            config.redis_url,
             decode_responses=True
         )
 
@@ -1,7 +1,7 @@
 from .youtube_utils import *
 from .video_utils import *
 from .ai import *
-from .config import Config
+from .config import get_config
 from datetime import datetime
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -31,16 +31,35 @@ from sqlalchemy import text
 from .models import User, Task, Source, GeneratedClip
 from .database import init_db, close_db, get_db, AsyncSessionLocal, Base
 from .api.routes.tasks import router as tasks_router
+from .workers.job_queue import JobQueue
 
-config = Config()
+config = get_config()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     try:
-        await init_db()
+        try:
+            await init_db()
+        except Exception as e:
+            # Keep serving (e.g. /health); get_db() retries init on first use
+            logger.error(f"❌ Failed to initialize database after retries: {e}")
+            logger.warning("⚠️  Application starting without database connection")
+
+        try:
+            app.state.arq_pool = await JobQueue.get_pool()
+        except Exception as e:
+            # get_arq_pool() connects lazily on the first task instead
+            logger.error(f"❌ Failed to initialize job queue after retries: {e}")
+            logger.warning("⚠️  Application starting without job queue connection")
         yield
     finally:
-        await close_db()
+        # Independent subsystems: close them concurrently
+        results = await asyncio.gather(
+            JobQueue.close_pool(), close_db(), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"❌ Error during shutdown: {result}")
 
 app = FastAPI(
     title="SupoClip API",
@@ -7,32 +7,48 @@ This is the new main entry point with:
 - Real-time progress updates via SSE
 - Thread pool for blocking operations
 """
+import asyncio
+import atexit
 from contextlib import asynccontextmanager
 from pathlib import Path
 import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import queue
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
 
-from .config import Config
-from .database import init_db, close_db, get_db
+from .config import get_config
+from .database import init_db, close_db, AsyncSessionLocal
 from .workers.job_queue import JobQueue
 from .api.routes import tasks
+from .utils.static_files import CachedStaticFiles
 
 # Configure logging
+# Records are handed to a background thread through a queue so the event
+# loop never blocks on stream/file writes.
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_listener = QueueListener(
+    _log_queue,
+    logging.StreamHandler(),
+    RotatingFileHandler('logs/backend.log', maxBytes=10 * 1024 * 1024, backupCount=5),
+    respect_handler_level=True,
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('logs/backend.log')
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
 
 logger = logging.getLogger(__name__)
-config = Config()
+config = get_config()
 
 
 @asynccontextmanager
@@ -56,7 +72,7 @@ async def lifespan(app: FastAPI):
 
         # Try to initialize job queue with retry logic
         try:
-            await JobQueue.get_pool()
+            app.state.arq_pool = await JobQueue.get_pool()
             logger.info("✅ Job queue initialized")
             queue_initialized = True
         except Exception as e:
@@ -74,10 +90,12 @@ async def lifespan(app: FastAPI):
     finally:
         # Shutdown
         logger.info("🛑 Shutting down SupoClip API...")
-        if db_initialized:
-            await close_db()
-        if queue_initialized:
-            await JobQueue.close_pool()
+        # Independent subsystems: close them concurrently. Both are closed
+        # unconditionally since either may have connected on first use.
+        cleanup = [JobQueue.close_pool(), close_db()]
+        for result in await asyncio.gather(*cleanup, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error(f"❌ Error during shutdown: {result}")
         logger.info("✅ Cleanup complete")
 
 
@@ -86,6 +104,7 @@ app = FastAPI(
     title="SupoClip API",
     description="Refactored Python backend for SupoClip with async job processing",
     version="0.2.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -101,7 +120,7 @@ app.add_middleware(
 # Mount static files for serving clips
 clips_dir = Path(config.temp_dir) / "clips"
 clips_dir.mkdir(parents=True, exist_ok=True)
-app.mount("/clips", StaticFiles(directory=str(clips_dir)), name="clips")
+app.mount("/clips", CachedStaticFiles(directory=str(clips_dir)), name="clips")
 
 # Include routers
 app.include_router(tasks.router)
@@ -129,23 +148,84 @@ async def health_check():
     return {"status": "healthy"}
 
 
-@app.get("/health/db")
-async def check_database_health(db: AsyncSession = Depends(get_db)):
-    """Check database connectivity."""
-    from sqlalchemy import text
+# Probe results are reused for a couple of seconds so bursts of external
+# health checks don't each hit Postgres/Redis.
+HEALTH_CACHE_TTL = 2.0
+_health_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+# One in-flight refresh per probe; concurrent callers await the same task
+_health_refreshes: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+# Redis probes answer within this many seconds, so probers with short
+# timeouts still get the "unhealthy" body instead of timing out
+REDIS_PING_TIMEOUT = 1.0
+# Background reconnect started by the Redis probe while the pool is down
+_redis_reconnect: Optional["asyncio.Task[None]"] = None
+
+
+async def _refresh_health(name: str, probe: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+    result = await probe()
+    _health_cache[name] = (time.monotonic(), result)
+    return result
+
+
+async def _cached_health(name: str, probe: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+    cached = _health_cache.get(name)
+    if cached is not None and time.monotonic() - cached[0] < HEALTH_CACHE_TTL:
+        return cached[1]
+
+    refresh = _health_refreshes.get(name)
+    if refresh is None:
+        refresh = asyncio.create_task(_refresh_health(name, probe))
+        _health_refreshes[name] = refresh
+        refresh.add_done_callback(lambda _: _health_refreshes.pop(name, None))
+    # Shielded so a disconnecting caller doesn't cancel the shared probe
+    return await asyncio.shield(refresh)
+
+
+async def _probe_database() -> Dict[str, Any]:
     try:
-        await db.execute(text("SELECT 1"))
+        async with AsyncSessionLocal() as db:
+            await db.execute(text("SELECT 1"))
         return {"status": "healthy", "database": "connected"}
     except Exception as e:
         return {"status": "unhealthy", "database": "disconnected", "error": str(e)}
 
 
-@app.get("/health/redis")
-async def check_redis_health():
-    """Check Redis connectivity."""
+async def _reconnect_redis(app: FastAPI) -> None:
+    try:
+        app.state.arq_pool = await JobQueue.get_pool()
+        logger.info("✅ Job queue reconnected")
+    except Exception as e:
+        logger.warning(f"⚠️  Job queue reconnect failed: {e}")
+
+
+def _start_redis_reconnect(app: FastAPI) -> None:
+    global _redis_reconnect
+    if _redis_reconnect is None or _redis_reconnect.done():
+        _redis_reconnect = asyncio.create_task(_reconnect_redis(app))
+
+
+async def _probe_redis(request: Request) -> Dict[str, Any]:
+    pool = getattr(request.app.state, "arq_pool", None)
+    if pool is None:
+        # Don't make the prober wait out a reconnect cycle; report now and
+        # let a later probe (or create_task) see the restored pool
+        _start_redis_reconnect(request.app)
+        return {"status": "unhealthy", "redis": "disconnected", "error": "Redis pool not connected; reconnecting"}
+
     try:
-        pool = await JobQueue.get_pool()
-        await pool.ping()
+        await asyncio.wait_for(pool.ping(), timeout=REDIS_PING_TIMEOUT)
         return {"status": "healthy", "redis": "connected"}
     except Exception as e:
-        return {"status": "unhealthy", "redis": "disconnected", "error": str(e)}
+        return {"status": "unhealthy", "redis": "disconnected", "error": str(e) or type(e).__name__}
+
+
+@app.get("/health/db")
+async def check_database_health():
+    """Check database connectivity."""
+    return await _cached_health("database", _probe_database)
+
+
+@app.get("/health/redis")
+async def check_redis_health(request: Request):
+    """Check Redis connectivity."""
+    return await _cached_health("redis", lambda: _probe_redis(request))
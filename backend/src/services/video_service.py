@@ -16,10 +16,10 @@ from ..video_utils import (
     create_clips_with_transitions
 )
 from ..ai import get_most_relevant_parts_by_transcript
-from ..config import Config
+from ..config import get_config
 
 logger = logging.getLogger(__name__)
-config = Config()
+config = get_config()
 
 
 class VideoService:
@@ -0,0 +1,119 @@
+"""
+StaticFiles variant that caches path resolution and file headers.
+"""
+import hashlib
+import os
+import stat
+import threading
+from collections import OrderedDict
+from email.utils import formatdate
+from typing import Dict, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+
+class _PrecomputedFileResponse(FileResponse):
+    """FileResponse whose stat headers were supplied by the caller."""
+
+    def set_stat_headers(self, stat_result: os.stat_result) -> None:
+        # content-length / last-modified / etag are already in self.headers
+        pass
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles that remembers resolved paths and their response headers.
+
+    Starlette re-resolves every request path (realpath + containment check)
+    and recomputes the ETag hash each time. Generated clips are requested
+    over and over while the frontend scrubs them, so both results are kept
+    in a bounded LRU. A single stat per request keeps them honest: a cached
+    path is only reused while it is still the same regular file (same
+    device/inode, not swapped for a symlink), otherwise Starlette's full
+    containment check runs again; cached headers are rebuilt whenever the
+    file's mtime or size changes, and deleted files drop out of the cache.
+    """
+
+    def __init__(self, *args, cache_size: int = 1024, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        # request path -> (resolved full path, st_dev, st_ino)
+        self._paths: "OrderedDict[str, Tuple[str, int, int]]" = OrderedDict()
+        # full path -> (mtime, size, headers)
+        self._headers: "OrderedDict[str, Tuple[float, int, Dict[str, str]]]" = OrderedDict()
+
+    def _remember(self, cache: OrderedDict, key: str, value) -> None:
+        with self._lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            if len(cache) > self._cache_size:
+                cache.popitem(last=False)
+
+    def lookup_path(self, path: str) -> Tuple[str, Optional[os.stat_result]]:
+        # Runs in a worker thread (see StaticFiles.get_response)
+        with self._lock:
+            cached = self._paths.get(path)
+
+        if cached is not None:
+            full_path, dev, ino = cached
+            try:
+                # lstat so a file replaced by a symlink isn't followed blindly
+                stat_result = (os.stat if self.follow_symlink else os.lstat)(full_path)
+            except (FileNotFoundError, NotADirectoryError):
+                stat_result = None
+
+            if (
+                stat_result is not None
+                and stat.S_ISREG(stat_result.st_mode)
+                and (stat_result.st_dev, stat_result.st_ino) == (dev, ino)
+            ):
+                return full_path, stat_result
+
+            # Gone or replaced: forget it and re-run the containment check
+            with self._lock:
+                self._paths.pop(path, None)
+                self._headers.pop(full_path, None)
+
+        full_path, stat_result = super().lookup_path(path)
+        if stat_result is not None and stat.S_ISREG(stat_result.st_mode):
+            self._remember(self._paths, path, (full_path, stat_result.st_dev, stat_result.st_ino))
+        return full_path, stat_result
+
+    def _stat_headers(self, full_path: str, stat_result: os.stat_result) -> Dict[str, str]:
+        with self._lock:
+            cached = self._headers.get(full_path)
+        if cached is not None:
+            mtime, size, headers = cached
+            if mtime == stat_result.st_mtime and size == stat_result.st_size:
+                return headers
+
+        # Same values Starlette's FileResponse.set_stat_headers produces
+        etag_base = f"{stat_result.st_mtime}-{stat_result.st_size}"
+        headers = {
+            "content-length": str(stat_result.st_size),
+            "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+            "etag": f'"{hashlib.md5(etag_base.encode(), usedforsecurity=False).hexdigest()}"',
+        }
+        self._remember(self._headers, full_path, (stat_result.st_mtime, stat_result.st_size, headers))
+        return headers
+
+    def file_response(
+        self,
+        full_path: str,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = _PrecomputedFileResponse(
+            full_path,
+            status_code=status_code,
+            headers=self._stat_headers(str(full_path), stat_result),
+            stat_result=stat_result,
+        )
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -1,9 +1,43 @@
 """
 Input validation utilities for security.
 """
-from urllib.parse import urlparse
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import urlsplit
 from fastapi import HTTPException
 
+_ALLOWED_YT_NETLOCS = frozenset({
+    'youtube.com',
+    'www.youtube.com',
+    'youtu.be',
+    'm.youtube.com',
+})
+
+# Longer URLs are rejected before reaching the cache, so it can't pin
+# arbitrarily large request strings for the life of the process
+_MAX_URL_LENGTH = 2048
+# How much of a rejected domain is echoed back in the error message
+_MAX_NETLOC_IN_ERROR = 100
+
+
+@lru_cache(maxsize=4096)
+def _check_youtube_netloc(url: str) -> Optional[str]:
+    """
+    Check a URL's domain against the YouTube allow-list.
+
+    Memoized, so it never raises: the outcome is returned as an error
+    message (or None when the URL is allowed) and raised by the caller.
+    """
+    try:
+        parsed = urlsplit(url)
+    except ValueError as e:
+        return f"Invalid URL format: {str(e)}"
+
+    if parsed.netloc.lower() not in _ALLOWED_YT_NETLOCS:
+        return f"Only YouTube URLs are allowed. Got domain: {parsed.netloc[:_MAX_NETLOC_IN_ERROR]}"
+
+    return None
+
 
 def validate_youtube_url(url: str) -> bool:
     """
@@ -18,28 +52,14 @@ def validate_youtube_url(url: str) -> bool:
     Raises:
         HTTPException: If URL is not from YouTube
     """
-    try:
-        parsed = urlparse(url)
-        allowed_domains = [
-            'youtube.com',
-            'www.youtube.com',
-            'youtu.be',
-            'm.youtube.com'
-        ]
-        
-        if parsed.netloc not in allowed_domains:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Only YouTube URLs are allowed. Got domain: {parsed.netloc}"
-            )
-        
-        return True
-        
-    except ValueError as e:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid URL format: {str(e)}"
-        )
+    if len(url) > _MAX_URL_LENGTH:
+        raise HTTPException(status_code=400, detail="URL is too long")
+
+    error = _check_youtube_netloc(url)
+    if error is not None:
+        raise HTTPException(status_code=400, detail=error)
+
+    return True
 
 
 def validate_task_input(data: dict) -> dict:
@@ -55,19 +75,25 @@ def validate_task_input(data: dict) -> dict:
     Raises:
         HTTPException: If validation fails
     """
-    raw_source = data.get("source")
-    
-    if not raw_source or not raw_source.get("url"):
+    try:
+        url = data["source"]["url"]
+    except (KeyError, TypeError):
+        url = None
+
+    # Non-string urls would break the memoized check (unhashable/no .lower)
+    if not isinstance(url, str) or not url:
         raise HTTPException(status_code=400, detail="Source URL is required")
     
     # Validate YouTube URL
-    validate_youtube_url(raw_source["url"])
+    validate_youtube_url(url)
     
     # Validate font options
-    font_options = data.get("font_options", {})
-    font_size = font_options.get("font_size", 24)
+    try:
+        font_size = data["font_options"]["font_size"]
+    except (KeyError, TypeError):
+        font_size = 24
     
-    if not isinstance(font_size, int) or font_size < 10 or font_size > 100:
+    if type(font_size) is not int or not 10 <= font_size <= 100:
         raise HTTPException(
             status_code=400,
             detail="Font size must be between 10 and 100"
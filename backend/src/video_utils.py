@@ -18,10 +18,10 @@ import assemblyai as aai
 import srt
 from datetime import timedelta
 
-from .config import Config
+from .config import get_config
 
 logger = logging.getLogger(__name__)
-config = Config()
+config = get_config()
 
 class VideoProcessor:
     """Handles video processing operations with optimized settings."""
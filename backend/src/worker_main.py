@@ -8,7 +8,6 @@ Usage:
 import logging
 from arq import run_worker
 from .workers.tasks import WorkerSettings
-from .config import Config
 
 # Configure logging for worker
 logging.basicConfig(
@@ -23,5 +22,6 @@ logger = logging.getLogger(__name__)
 
 if __name__ == "__main__":
     logger.info("Starting SupoClip worker...")
-    logger.info(f"Redis: {Config().redis_host}:{Config().redis_port}")
+    settings = WorkerSettings.redis_settings
+    logger.info(f"Redis: {settings.host}:{settings.port}")
     run_worker(WorkerSettings)
@@ -1,44 +1,103 @@
 """
 Job queue setup using arq (async Redis queue).
 """
+import asyncio
+import dataclasses
 import logging
+from functools import lru_cache
 from typing import Optional
+from urllib.parse import unquote
 from arq import create_pool
 from arq.connections import RedisSettings, ArqRedis
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import retry, stop_after_attempt, stop_after_delay, wait_exponential, retry_if_exception_type
 from redis.exceptions import ConnectionError, TimeoutError
-from src.config import Config
+from ..config import get_config
 
 logger = logging.getLogger(__name__)
-config = Config()
 
-# Use URL directly from config
-ARQ_REDIS_SETTINGS = RedisSettings.from_dsn(config.redis_url)
+
+def redis_settings_from_dsn(dsn: str) -> RedisSettings:
+    """RedisSettings.from_dsn, with percent-encoded credentials decoded."""
+    settings = RedisSettings.from_dsn(dsn)
+    # arq passes userinfo through as-is; redis-py's from_url unquotes it
+    return dataclasses.replace(
+        settings,
+        username=unquote(settings.username) if settings.username else settings.username,
+        password=unquote(settings.password) if settings.password else settings.password,
+    )
+
+
+@lru_cache(maxsize=1)
+def _arq_settings() -> RedisSettings:
+    """Build the arq Redis settings once, on first use."""
+    # arq retries internally (5 x 1s) by default; leave retrying to the
+    # tenacity policy on _create_pool so its ~5s budget holds
+    return dataclasses.replace(
+        redis_settings_from_dsn(get_config().redis_url), conn_retries=0
+    )
 
 
 class JobQueue:
     """Handles pushing, inspecting, and retrieving jobs."""
 
     _pool: Optional[ArqRedis] = None
+    # The connection attempt in flight, shared by every concurrent caller so
+    # they wait on one retry cycle instead of running one each in turn
+    _pool_task: Optional["asyncio.Task[ArqRedis]"] = None
+
+    @classmethod
+    async def get_pool(cls) -> ArqRedis:
+        if cls._pool is not None:
+            return cls._pool
+
+        # No await between the check and the assignment, so no lock needed
+        if cls._pool_task is None:
+            cls._pool_task = asyncio.ensure_future(cls._connect())
+        # Shielded: a cancelled caller must not abort the others' attempt
+        return await asyncio.shield(cls._pool_task)
+
+    @classmethod
+    async def _connect(cls) -> ArqRedis:
+        try:
+            cls._pool = await cls._create_pool()
+            return cls._pool
+        finally:
+            # Success or failure, the next caller after this starts afresh
+            # (unless close_pool already dropped this attempt for a newer one)
+            if cls._pool_task is asyncio.current_task():
+                cls._pool_task = None
 
     @classmethod
     @retry(
         retry=retry_if_exception_type((ConnectionError, TimeoutError)),
-        stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
+        # Keep startup fast (~5s worst case); later callers retry on first use
+        stop=(stop_after_attempt(4) | stop_after_delay(5)),
+        wait=wait_exponential(multiplier=0.5, min=0.2, max=2.0),
     )
-    async def get_pool(cls) -> ArqRedis:
-        if cls._pool:
-            return cls._pool
+    async def _create_pool(cls) -> ArqRedis:
+        settings = _arq_settings()
+        logger.info(f"🔌 Connecting to Redis: {settings.host}:{settings.port}")
+        return await create_pool(settings)
 
-        logger.info(f"🔌 Connecting to Redis: {config.redis_url}")
-        cls._pool = await create_pool(ARQ_REDIS_SETTINGS)
-        return cls._pool
+    @classmethod
+    async def close_pool(cls) -> None:
+        """Close the Redis pool, if one was opened."""
+        if cls._pool_task is not None:
+            # Don't hold up shutdown on a pending reconnect cycle
+            cls._pool_task.cancel()
+            cls._pool_task = None
+
+        # Detached before the await, so a second close finds nothing to close
+        pool, cls._pool = cls._pool, None
+        if pool is None:
+            return
+
+        await pool.close()
+        logger.info("🔻 Redis pool closed")
 
     @classmethod
-    async def enqueue(cls, task_name: str, **kwargs) -> str:
+    async def enqueue(cls, pool: ArqRedis, task_name: str, **kwargs) -> str:
         """Enqueue a task to Redis using arq."""
-        pool = await cls.get_pool()
         job = await pool.enqueue_job(task_name, **kwargs)
         if job:
             logger.info(f"🚀 Enqueued task {task_name} with ID: {job.job_id}")
@@ -46,23 +105,21 @@ class JobQueue:
         return ""
 
     @classmethod
-    async def get_job(cls, job_id: str):
-        pool = await cls.get_pool()
+    async def get_job(cls, pool: ArqRedis, job_id: str):
         job = await pool.job(job_id)
         return job
 
     @classmethod
-    async def get_job_result(cls, job_id: str):
-        pool = await cls.get_pool()
+    async def get_job_result(cls, pool: ArqRedis, job_id: str):
         job = await pool.job(job_id)
         if job:
             return await job.result()
         return None
 
     @classmethod
-    async def get_job_status(cls, job_id: str) -> Optional[str]:
-        pool = await cls.get_pool()
+    async def get_job_status(cls, pool: ArqRedis, job_id: str) -> Optional[str]:
         job = await pool.job(job_id)
         if job:
             return await job.status()
         return None
+
@@ -76,17 +76,17 @@ async def process_video_task(
 class WorkerSettings:
     """Configuration for arq worker."""
 
-    from ..config import Config
-    from arq.connections import RedisSettings
+    from ..config import get_config
+    from .job_queue import redis_settings_from_dsn
 
-    config = Config()
+    config = get_config()
 
     # Functions to run
     functions = [process_video_task]
     queue_name = "supoclip_tasks"
 
     # Redis settings from environment
-    redis_settings = RedisSettings.from_dsn(config.redis_url)
+    redis_settings = redis_settings_from_dsn(config.redis_url)
 
     # Retry settings
     max_tries = 3  # Retry failed jobs up to 3 times
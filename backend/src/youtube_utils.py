@@ -11,10 +11,10 @@ from pathlib import Path
 import logging
 import time
 
-from .config import Config
+from .config import get_config
 
 logger = logging.getLogger(__name__)
-config = Config()
+config = get_config()
 
 class YouTubeDownloader:
     """Enhanced YouTube downloader with optimized settings."""
@@ -41,7 +41,7 @@ def test_imports():
         from src.workers.job_queue import JobQueue
         print("✓ job queue")
         
-        from src.config import Config
+        from src.config import get_config
         print("✓ config")
         
         print("\n✅ All imports successful!\n")
@@ -172,22 +172,27 @@ def test_database_config():
     print("=" * 60)
     
     try:
-        from src.database import engine
+        from src.config import get_config
         
-        # Check connect_args
-        connect_args = engine.pool._creator.keywords.get('connect_args', {})
+        # Check connect_args (static config; no engine or DB connection needed)
+        config = get_config()
+        connect_args = config.database_connect_args
         
-        if connect_args.get('ssl') == 'require':
-            print("✓ SSL configured correctly")
+        if 'ssl' in connect_args:
+            print(f"✓ SSL mode from DATABASE_URL: {connect_args['ssl']}")
         else:
-            print("✗ SSL not configured")
-            return False
+            print("✓ SSL negotiated by asyncpg default (prefer); add ?sslmode=require to enforce")
         
-        if connect_args.get('statement_cache_size') == 0:
-            print("✓ Prepared statements disabled (pgbouncer compatible)")
-        else:
+        if config.pgbouncer_mode != 'transaction':
+            print("✓ Prepared statement cache enabled (direct connection)")
+        elif connect_args.get('statement_cache_size') != 0:
             print("✗ statement_cache_size not set to 0")
             return False
+        elif 'prepared_statement_name_func' not in connect_args:
+            print("✗ prepared_statement_name_func not set (names collide behind pgbouncer)")
+            return False
+        else:
+            print("✓ Prepared statements disabled (pgbouncer compatible)")
         
         print("\n✅ Database config tests passed!\n")
         return True